@@ -6,7 +6,8 @@ This script fetches content from Google Sheets and converts it to JSON
 format that the iOS app can consume.
 
 Usage:
-    python sync_content.py
+    python sync_content.py            # read the CSV files in ContentManagement/data/
+    python sync_content.py --remote   # fetch the sheets straight from Google Sheets
 
 The script will:
 1. Fetch all sheets from the Google Spreadsheet
@@ -15,14 +16,23 @@ The script will:
 4. Save to ../content/unlock_egypt_content.json
 """
 
+import base64
 import csv
+import http.client
+import io
 import json
+import urllib.parse
 import urllib.request
-import urllib.error
 import os
+import re
 import sys
-from datetime import datetime
-from typing import List, Tuple
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from itertools import groupby
+from operator import itemgetter
+from typing import List, Optional, Tuple
 
 # =============================================================================
 # VALIDATION CONFIGURATION
@@ -49,6 +59,21 @@ VALID_CITIES = [
 
 VALID_CARD_TYPES = ["intro", "story", "fact", "quiz", "image"]
 
+# Set versions for per-row membership checks (the lists above keep the
+# display order used in error messages)
+VALID_ERAS_SET = frozenset(VALID_ERAS)
+VALID_TOURISM_TYPES_SET = frozenset(VALID_TOURISM_TYPES)
+VALID_PLACE_TYPES_SET = frozenset(VALID_PLACE_TYPES)
+VALID_CITIES_SET = frozenset(VALID_CITIES)
+VALID_CARD_TYPES_SET = frozenset(VALID_CARD_TYPES)
+
+# Pre-joined value lists for "Must be one of" error messages
+VALID_ERAS_TEXT = ", ".join(VALID_ERAS)
+VALID_TOURISM_TYPES_TEXT = ", ".join(VALID_TOURISM_TYPES)
+VALID_PLACE_TYPES_TEXT = ", ".join(VALID_PLACE_TYPES)
+VALID_CITIES_TEXT = ", ".join(VALID_CITIES)
+VALID_CARD_TYPES_TEXT = ", ".join(VALID_CARD_TYPES)
+
 # Egypt geographic bounds (with some padding for edge cases)
 EGYPT_LAT_MIN = 21.0
 EGYPT_LAT_MAX = 32.0
@@ -69,23 +94,128 @@ ARABIC_CHAR_RANGES = [
     (0xFE70, 0xFEFF),  # Arabic Presentation Forms-B
 ]
 
+# Character class over the ranges above, so the scan runs in the regex engine
+ARABIC_CHAR_PATTERN = re.compile(
+    "[" + "".join(f"{chr(start)}-{chr(end)}" for start, end in ARABIC_CHAR_RANGES) + "]"
+)
+
 
 def contains_arabic(text: str) -> bool:
     """Check if text contains at least one Arabic character"""
-    for char in text:
-        code = ord(char)
-        for start, end in ARABIC_CHAR_RANGES:
-            if start <= code <= end:
-                return True
-    return False
+    return ARABIC_CHAR_PATTERN.search(text) is not None
+
+
+# An http(s) URL, or a local image name with a known extension
+URL_OR_IMAGE_PATTERN = re.compile(r"https?://|.*\.(?:jpe?g|png|webp|gif)$", re.IGNORECASE | re.DOTALL)
 
 
 def is_valid_url(url: str) -> bool:
     """Basic URL validation"""
     if not url:
         return True  # Empty is OK (optional field)
-    url = url.strip().lower()
-    return url.startswith(('http://', 'https://')) or url.endswith(('.jpg', '.jpeg', '.png', '.webp', '.gif'))
+    return URL_OR_IMAGE_PATTERN.match(url.strip()) is not None
+
+
+def parse_coordinate(text: str, low: float, high: float) -> Tuple[Optional[float], bool]:
+    """
+    Parse a latitude/longitude string.
+    Returns (value, in_range); value is None if the text isn't a number.
+    """
+    try:
+        value = float(text)
+    except ValueError:
+        return None, False
+    return value, low <= value <= high
+
+
+# Redirect statuses followed when checking a URL, and how many hops to allow
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+MAX_URL_REDIRECTS = 10
+
+# Statuses some CDNs return for HEAD on files that do exist (signed S3 URLs,
+# edge workers); those URLs are re-checked with a one-byte ranged GET
+HEAD_REJECTED_STATUSES = (403, 405, 501)
+
+# Response bodies up to this size are read so the connection can be reused;
+# anything larger (a server ignoring Range) closes the connection instead
+MAX_DRAINED_BODY_BYTES = 64 * 1024
+
+# Keep-alive connections for URL checks: one per (scheme, host) in each
+# worker thread, so checks against the same CDN reuse the TCP/TLS session
+_url_check_connections = threading.local()
+
+
+def open_url_check_connection(parts: urllib.parse.SplitResult, timeout: int) -> Tuple[http.client.HTTPConnection, bool, dict]:
+    """
+    Open a connection to the URL's host, through the same proxy urlopen would
+    use (http_proxy/https_proxy, no_proxy, or the system proxy settings).
+    Returns (connection, whether requests must use the absolute URL, extra request headers).
+    """
+    connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+
+    proxy = urllib.request.getproxies().get(parts.scheme)
+    if not proxy or urllib.request.proxy_bypass(parts.hostname or ""):
+        return connection_class(parts.netloc, timeout=timeout), False, {}
+
+    if "://" not in proxy:
+        proxy = "http://" + proxy
+    proxy_parts = urllib.parse.urlsplit(proxy)
+    proxy_headers = {}
+    if proxy_parts.username is not None:
+        credentials = f"{urllib.parse.unquote(proxy_parts.username)}:{urllib.parse.unquote(proxy_parts.password or '')}"
+        proxy_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(credentials.encode()).decode("ascii")
+
+    conn = connection_class(proxy_parts.hostname, proxy_parts.port, timeout=timeout)
+    if parts.scheme == "https":
+        # TLS to the image host inside a CONNECT tunnel through the proxy
+        conn.set_tunnel(parts.hostname, parts.port, headers=proxy_headers)
+        return conn, False, {}
+    # Plain HTTP goes to the proxy itself, which expects the absolute URL
+    return conn, True, proxy_headers
+
+
+def url_request(url: str, timeout: int, method: str = "HEAD", headers: Optional[dict] = None) -> http.client.HTTPResponse:
+    """
+    Send a request over this thread's keep-alive connection to the URL's host.
+    Reconnects once if the server has closed a previously used connection.
+    Bodies are only drained when small; otherwise the connection is dropped
+    rather than downloading the payload.
+    """
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+
+    pool = getattr(_url_check_connections, "pool", None)
+    if pool is None:
+        pool = _url_check_connections.pool = {}
+    key = (parts.scheme, parts.netloc)
+
+    def send(conn, absolute_target, extra_headers):
+        target = urllib.parse.urlunsplit((parts.scheme, parts.netloc, path, "", "")) if absolute_target else path
+        try:
+            conn.request(method, target, headers={'User-Agent': 'Mozilla/5.0', **extra_headers, **(headers or {})})
+            response = conn.getresponse()
+            if response.length is not None and response.length <= MAX_DRAINED_BODY_BYTES:
+                response.read()  # Frees the connection for reuse
+            else:
+                conn.close()
+                pool.pop(key, None)
+            return response
+        except Exception:
+            conn.close()
+            pool.pop(key, None)
+            raise
+
+    entry = pool.get(key)
+    if entry is not None:
+        try:
+            return send(*entry)
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            pass  # Idle connection was dropped by the server - reconnect below
+
+    entry = pool[key] = open_url_check_connection(parts, timeout)
+    return send(*entry)
 
 
 def check_url_exists(url: str, timeout: int = 5) -> Tuple[bool, str]:
@@ -101,20 +231,30 @@ def check_url_exists(url: str, timeout: int = 5) -> Tuple[bool, str]:
         return True, ""  # Skip non-URL image names (local assets)
 
     try:
-        req = urllib.request.Request(url, method='HEAD', headers={'User-Agent': 'Mozilla/5.0'})
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            if response.status == 200:
+        for _ in range(MAX_URL_REDIRECTS + 1):
+            response = url_request(url, timeout)
+            if response.status in HEAD_REJECTED_STATUSES:
+                # Some CDNs refuse HEAD; ask for the first byte instead
+                response = url_request(url, timeout, "GET", {"Range": "bytes=0-0"})
+            location = response.getheader("Location")
+            if response.status in REDIRECT_STATUSES and location:
+                url = urllib.parse.urljoin(url, location)
+                if not url.startswith(('http://', 'https://')):
+                    return False, "Redirected to non-HTTP URL"
+                continue
+            if response.status in (200, 206):
                 return True, ""
-            else:
-                return False, f"HTTP {response.status}"
-    except urllib.error.HTTPError as e:
-        return False, f"HTTP {e.code}"
-    except urllib.error.URLError as e:
-        return False, f"Connection failed: {str(e.reason)[:30]}"
+            return False, f"HTTP {response.status}"
+        return False, "Too many redirects"
+    except (http.client.HTTPException, OSError) as e:
+        return False, f"Connection failed: {str(e)[:30]}"
     except Exception as e:
         return False, f"Error: {str(e)[:30]}"
 
 
+# Number of URL existence checks to run in parallel
+URL_CHECK_WORKERS = 20
+
 # Minimum content lengths for meaningful content
 MIN_CONTENT_LENGTH = 10
 MIN_DESCRIPTION_LENGTH = 10  # Lowered to allow short but valid descriptions
@@ -122,6 +262,8 @@ MIN_DESCRIPTION_LENGTH = 10  # Lowered to allow short but valid descriptions
 
 class ValidationError:
     """Represents a single validation error"""
+    __slots__ = ("sheet", "row", "field", "message")
+
     def __init__(self, sheet: str, row: int, field: str, message: str):
         self.sheet = sheet
         self.row = row  # 1-based row number (including header)
@@ -132,16 +274,31 @@ class ValidationError:
         return f"[{self.sheet}] Row {self.row}, '{self.field}': {self.message}"
 
 
-def validate_all_sheets(sheets_data: dict) -> List[ValidationError]:
+def first_occurrence_rows(rows: list, field: str) -> dict:
+    """
+    Map each non-empty value of a column to the sheet row where it first appears.
+    Row numbers are 1-based and count the header, like ValidationError.row.
+    """
+    first_rows = {}
+    for idx, row in enumerate(rows):
+        value = row.get(field, "").strip()
+        if value and value not in first_rows:
+            first_rows[value] = idx + 2
+    return first_rows
+
+
+def validate_all_sheets(sheets_data: dict, verbose: bool = True) -> List[ValidationError]:
     """
     Validate all sheets for structural and data integrity issues.
+    Progress is printed unless verbose is False.
     Returns a list of all validation errors found.
     """
     errors = []
 
-    # First, collect all valid IDs for foreign key validation
-    site_ids = set()
-    sublocation_ids = set()
+    # Bound pattern methods for the per-row checks (contains_arabic /
+    # is_valid_url minus their empty/strip handling - values here are stripped)
+    find_arabic = ARABIC_CHAR_PATTERN.search
+    match_url_or_image = URL_OR_IMAGE_PATTERN.match
 
     sites = sheets_data.get("Sites", [])
     sublocations = sheets_data.get("SubLocations", [])
@@ -149,21 +306,27 @@ def validate_all_sheets(sheets_data: dict) -> List[ValidationError]:
     tips = sheets_data.get("Tips", [])
     phrases = sheets_data.get("ArabicPhrases", [])
 
+    # First, collect all valid IDs for foreign key validation. Any later row
+    # reusing an ID is a duplicate.
+    site_rows = first_occurrence_rows(sites, "id")
+    subloc_rows = first_occurrence_rows(sublocations, "id")
+    site_ids = frozenset(site_rows)
+    sublocation_ids = frozenset(subloc_rows)
+
     # ==========================================================================
     # VALIDATE SITES SHEET
     # ==========================================================================
-    print("   Validating Sites...")
+    if verbose:
+        print("   Validating Sites...")
     for idx, site in enumerate(sites):
         row_num = idx + 2  # +2 because idx is 0-based and row 1 is header
 
         # Required fields
-        if not site.get("id", "").strip():
+        site_id = site.get("id", "").strip()
+        if not site_id:
             errors.append(ValidationError("Sites", row_num, "id", "Missing required field"))
-        else:
-            site_id = site.get("id", "").strip()
-            if site_id in site_ids:
-                errors.append(ValidationError("Sites", row_num, "id", f"Duplicate site ID: '{site_id}'"))
-            site_ids.add(site_id)
+        elif site_rows[site_id] != row_num:
+            errors.append(ValidationError("Sites", row_num, "id", f"Duplicate site ID: '{site_id}'"))
 
         if not site.get("name", "").strip():
             errors.append(ValidationError("Sites", row_num, "name", "Missing required field"))
@@ -171,7 +334,7 @@ def validate_all_sheets(sheets_data: dict) -> List[ValidationError]:
         arabic_name = site.get("arabicName", "").strip()
         if not arabic_name:
             errors.append(ValidationError("Sites", row_num, "arabicName", "Missing required field"))
-        elif not contains_arabic(arabic_name):
+        elif not find_arabic(arabic_name):
             errors.append(ValidationError("Sites", row_num, "arabicName",
                 f"Should contain Arabic characters: '{arabic_name}'"))
 
@@ -179,73 +342,54 @@ def validate_all_sheets(sheets_data: dict) -> List[ValidationError]:
         era = site.get("era", "").strip()
         if not era:
             errors.append(ValidationError("Sites", row_num, "era", "Missing required field"))
-        elif era not in VALID_ERAS:
+        elif era not in VALID_ERAS_SET:
             errors.append(ValidationError("Sites", row_num, "era",
-                f"Invalid value '{era}'. Must be one of: {', '.join(VALID_ERAS)}"))
+                f"Invalid value '{era}'. Must be one of: {VALID_ERAS_TEXT}"))
 
         # Validate tourismType
         tourism = site.get("tourismType", "").strip()
         if not tourism:
             errors.append(ValidationError("Sites", row_num, "tourismType", "Missing required field"))
-        elif tourism not in VALID_TOURISM_TYPES:
+        elif tourism not in VALID_TOURISM_TYPES_SET:
             errors.append(ValidationError("Sites", row_num, "tourismType",
-                f"Invalid value '{tourism}'. Must be one of: {', '.join(VALID_TOURISM_TYPES)}"))
+                f"Invalid value '{tourism}'. Must be one of: {VALID_TOURISM_TYPES_TEXT}"))
 
         # Validate placeType
         place = site.get("placeType", "").strip()
         if not place:
             errors.append(ValidationError("Sites", row_num, "placeType", "Missing required field"))
-        elif place not in VALID_PLACE_TYPES:
+        elif place not in VALID_PLACE_TYPES_SET:
             errors.append(ValidationError("Sites", row_num, "placeType",
-                f"Invalid value '{place}'. Must be one of: {', '.join(VALID_PLACE_TYPES)}"))
+                f"Invalid value '{place}'. Must be one of: {VALID_PLACE_TYPES_TEXT}"))
 
         # Validate city
         city = site.get("city", "").strip()
         if not city:
             errors.append(ValidationError("Sites", row_num, "city", "Missing required field"))
-        elif city not in VALID_CITIES:
+        elif city not in VALID_CITIES_SET:
             errors.append(ValidationError("Sites", row_num, "city",
-                f"Invalid value '{city}'. Must be one of: {', '.join(VALID_CITIES)}"))
+                f"Invalid value '{city}'. Must be one of: {VALID_CITIES_TEXT}"))
 
         # Validate coordinates
-        lat_str = site.get("latitude", "").strip()
-        lon_str = site.get("longitude", "").strip()
-
-        lat_valid = False
-        lon_valid = False
-        lat = 0
-        lon = 0
-
-        if not lat_str:
-            errors.append(ValidationError("Sites", row_num, "latitude", "Missing required field"))
-        else:
-            try:
-                lat = float(lat_str)
-                lat_valid = True
-                if lat < -90 or lat > 90:
-                    errors.append(ValidationError("Sites", row_num, "latitude",
-                        f"Invalid latitude {lat}. Must be between -90 and 90"))
-                    lat_valid = False
-            except ValueError:
-                errors.append(ValidationError("Sites", row_num, "latitude",
-                    f"Invalid number format: '{lat_str}'"))
-
-        if not lon_str:
-            errors.append(ValidationError("Sites", row_num, "longitude", "Missing required field"))
-        else:
-            try:
-                lon = float(lon_str)
-                lon_valid = True
-                if lon < -180 or lon > 180:
-                    errors.append(ValidationError("Sites", row_num, "longitude",
-                        f"Invalid longitude {lon}. Must be between -180 and 180"))
-                    lon_valid = False
-            except ValueError:
-                errors.append(ValidationError("Sites", row_num, "longitude",
-                    f"Invalid number format: '{lon_str}'"))
+        coords = {}
+        for field, low, high in (("latitude", -90, 90), ("longitude", -180, 180)):
+            value_str = site.get(field, "").strip()
+            if not value_str:
+                errors.append(ValidationError("Sites", row_num, field, "Missing required field"))
+                continue
+            value, in_range = parse_coordinate(value_str, low, high)
+            if value is None:
+                errors.append(ValidationError("Sites", row_num, field,
+                    f"Invalid number format: '{value_str}'"))
+            elif not in_range:
+                errors.append(ValidationError("Sites", row_num, field,
+                    f"Invalid {field} {value}. Must be between {low} and {high}"))
+            else:
+                coords[field] = value
 
         # Check if coordinates are within Egypt (catches copy/paste errors)
-        if lat_valid and lon_valid:
+        if len(coords) == 2:
+            lat, lon = coords["latitude"], coords["longitude"]
             if not (EGYPT_LAT_MIN <= lat <= EGYPT_LAT_MAX and EGYPT_LON_MIN <= lon <= EGYPT_LON_MAX):
                 errors.append(ValidationError("Sites", row_num, "coordinates",
                     f"Location ({lat}, {lon}) is outside Egypt. Expected lat {EGYPT_LAT_MIN}-{EGYPT_LAT_MAX}, lon {EGYPT_LON_MIN}-{EGYPT_LON_MAX}"))
@@ -263,7 +407,7 @@ def validate_all_sheets(sheets_data: dict) -> List[ValidationError]:
         if image_names:
             for img_name in image_names.split(","):
                 img_name = img_name.strip()
-                if img_name and not is_valid_url(img_name):
+                if img_name and not match_url_or_image(img_name):
                     if " " in img_name:
                         errors.append(ValidationError("Sites", row_num, "imageNames",
                             f"Image name contains spaces: '{img_name}'"))
@@ -271,19 +415,18 @@ def validate_all_sheets(sheets_data: dict) -> List[ValidationError]:
     # ==========================================================================
     # VALIDATE SUBLOCATIONS SHEET
     # ==========================================================================
-    print("   Validating SubLocations...")
+    if verbose:
+        print("   Validating SubLocations...")
     for idx, subloc in enumerate(sublocations):
         row_num = idx + 2
 
         # Required fields
-        if not subloc.get("id", "").strip():
+        subloc_id = subloc.get("id", "").strip()
+        if not subloc_id:
             errors.append(ValidationError("SubLocations", row_num, "id", "Missing required field"))
-        else:
-            subloc_id = subloc.get("id", "").strip()
-            if subloc_id in sublocation_ids:
-                errors.append(ValidationError("SubLocations", row_num, "id",
-                    f"Duplicate sublocation ID: '{subloc_id}'"))
-            sublocation_ids.add(subloc_id)
+        elif subloc_rows[subloc_id] != row_num:
+            errors.append(ValidationError("SubLocations", row_num, "id",
+                f"Duplicate sublocation ID: '{subloc_id}'"))
 
         if not subloc.get("name", "").strip():
             errors.append(ValidationError("SubLocations", row_num, "name", "Missing required field"))
@@ -299,8 +442,16 @@ def validate_all_sheets(sheets_data: dict) -> List[ValidationError]:
     # ==========================================================================
     # VALIDATE CARDS SHEET
     # ==========================================================================
-    print("   Validating Cards...")
+    if verbose:
+        print("   Validating Cards...")
     card_ids = set()
+    cards_by_subloc = defaultdict(list)  # subloc_id -> [(order, row_num)] for the duplicate-order check
+    sublocs_with_cards = set()
+    urls_to_check = []
+    seen_content = {}
+    # Content-quality findings are reported after the URL phase so that,
+    # as before, they don't suppress URL checking
+    quality_errors = []
     for idx, card in enumerate(cards):
         row_num = idx + 2
 
@@ -324,12 +475,13 @@ def validate_all_sheets(sheets_data: dict) -> List[ValidationError]:
 
         # Validate card type
         card_type = card.get("type", "").strip().lower()
-        if card_type and card_type not in VALID_CARD_TYPES:
+        if card_type and card_type not in VALID_CARD_TYPES_SET:
             errors.append(ValidationError("Cards", row_num, "type",
-                f"Invalid value '{card_type}'. Must be one of: {', '.join(VALID_CARD_TYPES)}"))
+                f"Invalid value '{card_type}'. Must be one of: {VALID_CARD_TYPES_TEXT}"))
 
         # Validate order
         order_str = card.get("order", "").strip()
+        order = 0
         if order_str:
             try:
                 order = int(order_str)
@@ -337,21 +489,23 @@ def validate_all_sheets(sheets_data: dict) -> List[ValidationError]:
                     errors.append(ValidationError("Cards", row_num, "order",
                         f"Order must be a positive number, got: {order}"))
             except ValueError:
+                order = None
                 errors.append(ValidationError("Cards", row_num, "order",
                     f"Invalid number format: '{order_str}'"))
 
+        if subloc_id:
+            sublocs_with_cards.add(subloc_id)
+
+        # Track card order per sublocation
+        if subloc_id and order is not None:
+            cards_by_subloc[subloc_id].append((order, row_num))
+
         # Validate quiz fields if quiz question exists
         quiz_question = card.get("quizQuestion", "").strip()
         if quiz_question:
-            # Check all quiz options are present
-            options = [
-                card.get("quizOption1", "").strip(),
-                card.get("quizOption2", "").strip(),
-                card.get("quizOption3", "").strip(),
-                card.get("quizOption4", "").strip()
-            ]
-
-            empty_options = [i+1 for i, opt in enumerate(options) if not opt]
+            # Check all quiz options are present (stripped once, reused for the answer check)
+            options = tuple(card.get(f"quizOption{i}", "").strip() for i in range(1, 5))
+            empty_options = [i for i, opt in enumerate(options, start=1) if not opt]
             if empty_options:
                 errors.append(ValidationError("Cards", row_num, "quizOptions",
                     f"Quiz has question but missing options: {empty_options}"))
@@ -367,6 +521,10 @@ def validate_all_sheets(sheets_data: dict) -> List[ValidationError]:
                     if correct < 1 or correct > 4:
                         errors.append(ValidationError("Cards", row_num, "quizCorrectAnswer",
                             f"Must be 1-4, got: {correct}"))
+                    elif not options[correct - 1]:
+                        # Check quiz answer points to non-empty option
+                        quality_errors.append(ValidationError("Cards", row_num, "quizCorrectAnswer",
+                            f"Points to empty option {correct}"))
                 except ValueError:
                     errors.append(ValidationError("Cards", row_num, "quizCorrectAnswer",
                         f"Invalid number format: '{correct_str}'"))
@@ -384,10 +542,14 @@ def validate_all_sheets(sheets_data: dict) -> List[ValidationError]:
 
         # Validate image URL format
         image_url = card.get("imageUrl", "").strip()
-        if image_url and not is_valid_url(image_url):
+        if image_url and not match_url_or_image(image_url):
             errors.append(ValidationError("Cards", row_num, "imageUrl",
                 f"Invalid URL format: '{image_url[:50]}...'"))
 
+        # Collect external URLs for the existence check below
+        if image_url and image_url.startswith(('http://', 'https://')):
+            urls_to_check.append(("Cards", row_num, "imageUrl", image_url))
+
         # Check for empty content on story/fact cards (should have something)
         fun_fact = card.get("funFact", "").strip()
         if card_type == "story" and not content and not image_url:
@@ -397,35 +559,43 @@ def validate_all_sheets(sheets_data: dict) -> List[ValidationError]:
             errors.append(ValidationError("Cards", row_num, "funFact",
                 f"Fact card should have funFact or content"))
 
-    # Check card order consistency per sublocation
-    cards_by_subloc = {}
-    for idx, card in enumerate(cards):
-        subloc_id = card.get("subLocationId", "").strip()
-        if subloc_id:
-            if subloc_id not in cards_by_subloc:
-                cards_by_subloc[subloc_id] = []
-            order_str = card.get("order", "0").strip()
-            try:
-                order = int(order_str) if order_str else 0
-                cards_by_subloc[subloc_id].append((order, idx + 2))
-            except ValueError:
-                pass
+        # Check for very short card content
+        if card_type == "story" and content and len(content) < MIN_CONTENT_LENGTH:
+            quality_errors.append(ValidationError("Cards", row_num, "content",
+                f"Very short ({len(content)} chars). Minimum {MIN_CONTENT_LENGTH} recommended"))
+        if card_type == "fact" and fun_fact and len(fun_fact) < MIN_CONTENT_LENGTH:
+            quality_errors.append(ValidationError("Cards", row_num, "funFact",
+                f"Very short ({len(fun_fact)} chars). Minimum {MIN_CONTENT_LENGTH} recommended"))
+
+        # Check for duplicate content (copy/paste errors)
+        if content and len(content) > 50:  # Only check substantial content
+            # Key on a hash of the first 100 chars so the map holds ints, not text
+            content_key = hash(content[:100].casefold())
+            if content_key in seen_content:
+                prev_row = seen_content[content_key]
+                quality_errors.append(ValidationError("Cards", row_num, "content",
+                    f"Duplicate content (same as row {prev_row})"))
+            else:
+                seen_content[content_key] = row_num
 
+    # Check card order consistency per sublocation
     for subloc_id, order_list in cards_by_subloc.items():
-        orders = [o[0] for o in order_list]
-        if len(orders) != len(set(orders)):
-            # Find duplicates
+        order_counts = Counter(order for order, _ in order_list)
+        if len(order_counts) != len(order_list):
+            # Flag every repeat after the first occurrence of a duplicated order
             seen = set()
             for order, row_num in order_list:
-                if order in seen:
-                    errors.append(ValidationError("Cards", row_num, "order",
-                        f"Duplicate order {order} in sublocation '{subloc_id}'"))
-                seen.add(order)
+                if order_counts[order] > 1:
+                    if order in seen:
+                        errors.append(ValidationError("Cards", row_num, "order",
+                            f"Duplicate order {order} in sublocation '{subloc_id}'"))
+                    seen.add(order)
 
     # ==========================================================================
     # VALIDATE TIPS SHEET
     # ==========================================================================
-    print("   Validating Tips...")
+    if verbose:
+        print("   Validating Tips...")
     for idx, tip in enumerate(tips):
         row_num = idx + 2
 
@@ -437,6 +607,15 @@ def validate_all_sheets(sheets_data: dict) -> List[ValidationError]:
             errors.append(ValidationError("Tips", row_num, "siteId",
                 f"References non-existent site: '{site_id}'"))
 
+        # Validate order
+        order_str = tip.get("order", "").strip()
+        if order_str:
+            try:
+                int(order_str)
+            except ValueError:
+                errors.append(ValidationError("Tips", row_num, "order",
+                    f"Invalid number format: '{order_str}'"))
+
         tip_text = tip.get("tip", "").strip()
         if not tip_text:
             errors.append(ValidationError("Tips", row_num, "tip", "Missing required field"))
@@ -447,7 +626,8 @@ def validate_all_sheets(sheets_data: dict) -> List[ValidationError]:
     # ==========================================================================
     # VALIDATE ARABIC PHRASES SHEET
     # ==========================================================================
-    print("   Validating ArabicPhrases...")
+    if verbose:
+        print("   Validating ArabicPhrases...")
     for idx, phrase in enumerate(phrases):
         row_num = idx + 2
 
@@ -465,7 +645,7 @@ def validate_all_sheets(sheets_data: dict) -> List[ValidationError]:
         arabic_text = phrase.get("arabic", "").strip()
         if not arabic_text:
             errors.append(ValidationError("ArabicPhrases", row_num, "arabic", "Missing required field"))
-        elif not contains_arabic(arabic_text):
+        elif not find_arabic(arabic_text):
             errors.append(ValidationError("ArabicPhrases", row_num, "arabic",
                 f"Should contain Arabic characters: '{arabic_text}'"))
 
@@ -475,19 +655,13 @@ def validate_all_sheets(sheets_data: dict) -> List[ValidationError]:
     # ==========================================================================
     # CROSS-SHEET VALIDATION (Orphan checks)
     # ==========================================================================
-    print("   Checking for orphaned records...")
+    if verbose:
+        print("   Checking for orphaned records...")
 
-    # Check for sites with no sublocations
-    sites_with_sublocations = set(s.get("siteId", "").strip() for s in sublocations)
-    for site_id in site_ids:
-        if site_id not in sites_with_sublocations:
-            # This is a warning, not an error - some sites might intentionally have no sublocations
-            pass  # Uncomment below to make it an error:
-            # errors.append(ValidationError("Sites", "N/A", "subLocations",
-            #     f"Site '{site_id}' has no sublocations"))
+    # Sites with no sublocations are allowed - some sites intentionally have none
 
     # Check for sublocations with no cards
-    sublocs_with_cards = set(c.get("subLocationId", "").strip() for c in cards)
+    # One error per row, so duplicated IDs without cards are reported on each row
     for idx, subloc in enumerate(sublocations):
         subloc_id = subloc.get("id", "").strip()
         if subloc_id and subloc_id not in sublocs_with_cards:
@@ -498,37 +672,40 @@ def validate_all_sheets(sheets_data: dict) -> List[ValidationError]:
     # URL EXISTENCE VALIDATION (only if no other errors - URLs can be slow)
     # ==========================================================================
     if not errors:
-        print("   Validating URLs (this may take a moment)...")
-        urls_to_check = []
-
-        # Collect all URLs from cards
-        for idx, card in enumerate(cards):
-            image_url = card.get("imageUrl", "").strip()
-            if image_url and image_url.startswith(('http://', 'https://')):
-                urls_to_check.append(("Cards", idx + 2, "imageUrl", image_url))
+        if verbose:
+            print("   Validating URLs (this may take a moment)...")
 
-        # Check URLs (with progress indicator)
+        # Check URLs concurrently (with progress indicator) - each check is
+        # a blocking HEAD request, so threads overlap the network waits
         if urls_to_check:
-            checked = 0
+            # Cards often share an image; request each distinct URL only once
+            unique_urls = list(dict.fromkeys(url for _, _, _, url in urls_to_check))
+            with ThreadPoolExecutor(max_workers=URL_CHECK_WORKERS) as executor:
+                futures = {url: executor.submit(check_url_exists, url) for url in unique_urls}
+                # Show progress roughly every 10% as checks complete
+                progress_step = max(1, len(unique_urls) // 10)
+                for checked, _ in enumerate(as_completed(futures.values()), start=1):
+                    if verbose and checked % progress_step == 0 and checked < len(unique_urls):
+                        print(f"      Checked {checked}/{len(unique_urls)} URLs...")
+            url_results = {url: future.result() for url, future in futures.items()}
+
+            # Report in sheet order regardless of completion order
             for sheet, row, field, url in urls_to_check:
-                checked += 1
-                exists, error_msg = check_url_exists(url)
+                exists, error_msg = url_results[url]
                 if not exists:
                     errors.append(ValidationError(sheet, row, field,
                         f"URL not accessible ({error_msg}): {url[:60]}..."))
-                # Show progress every 5 URLs
-                if checked % 5 == 0:
-                    print(f"      Checked {checked}/{len(urls_to_check)} URLs...")
 
-            if urls_to_check:
-                print(f"      Checked {len(urls_to_check)} URLs")
-        else:
+            if verbose:
+                print(f"      Checked {len(unique_urls)} URLs")
+        elif verbose:
             print("      No external URLs to check")
 
     # ==========================================================================
     # CONTENT QUALITY CHECKS
     # ==========================================================================
-    print("   Checking content quality...")
+    if verbose:
+        print("   Checking content quality...")
 
     # Check for very short descriptions (might be placeholder text)
     for idx, site in enumerate(sites):
@@ -537,49 +714,8 @@ def validate_all_sheets(sheets_data: dict) -> List[ValidationError]:
             errors.append(ValidationError("Sites", idx + 2, "shortDescription",
                 f"Very short ({len(desc)} chars). Minimum {MIN_DESCRIPTION_LENGTH} recommended"))
 
-    # Check for very short card content
-    for idx, card in enumerate(cards):
-        content = card.get("content", "").strip()
-        fun_fact = card.get("funFact", "").strip()
-        card_type = card.get("type", "").strip().lower()
-
-        if card_type == "story" and content and len(content) < MIN_CONTENT_LENGTH:
-            errors.append(ValidationError("Cards", idx + 2, "content",
-                f"Very short ({len(content)} chars). Minimum {MIN_CONTENT_LENGTH} recommended"))
-
-        if card_type == "fact" and fun_fact and len(fun_fact) < MIN_CONTENT_LENGTH:
-            errors.append(ValidationError("Cards", idx + 2, "funFact",
-                f"Very short ({len(fun_fact)} chars). Minimum {MIN_CONTENT_LENGTH} recommended"))
-
-    # Check for duplicate content (copy/paste errors)
-    seen_content = {}
-    for idx, card in enumerate(cards):
-        content = card.get("content", "").strip()
-        if content and len(content) > 50:  # Only check substantial content
-            content_key = content[:100].lower()  # Use first 100 chars as key
-            if content_key in seen_content:
-                prev_row = seen_content[content_key]
-                errors.append(ValidationError("Cards", idx + 2, "content",
-                    f"Duplicate content (same as row {prev_row})"))
-            else:
-                seen_content[content_key] = idx + 2
-
-    # Check quiz answer points to non-empty option
-    for idx, card in enumerate(cards):
-        quiz_question = card.get("quizQuestion", "").strip()
-        if quiz_question:
-            correct_str = card.get("quizCorrectAnswer", "").strip()
-            if correct_str:
-                try:
-                    correct = int(correct_str)
-                    if 1 <= correct <= 4:
-                        option_field = f"quizOption{correct}"
-                        option_value = card.get(option_field, "").strip()
-                        if not option_value:
-                            errors.append(ValidationError("Cards", idx + 2, "quizCorrectAnswer",
-                                f"Points to empty option {correct}"))
-                except ValueError:
-                    pass  # Already caught by earlier validation
+    # Card checks were gathered during the Cards pass
+    errors.extend(quality_errors)
 
     return errors
 
@@ -596,10 +732,8 @@ def print_validation_report(errors: List[ValidationError]) -> bool:
         return True
 
     # Group errors by sheet
-    errors_by_sheet = {}
+    errors_by_sheet = defaultdict(list)
     for error in errors:
-        if error.sheet not in errors_by_sheet:
-            errors_by_sheet[error.sheet] = []
         errors_by_sheet[error.sheet].append(error)
 
     print("\n" + "=" * 60)
@@ -633,23 +767,51 @@ SHEETS = {
     "ArabicPhrases": 2026607677,
 }
 
+# Local paths (resolved once at import)
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(SCRIPT_DIR, 'data')
+PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
+CONTENT_DIR = os.path.join(PROJECT_DIR, 'content')
+RESOURCES_DIR = os.path.join(PROJECT_DIR, 'Resources')
+JSON_FILENAME = 'unlock_egypt_content.json'
+CONTENT_JSON_PATH = os.path.join(CONTENT_DIR, JSON_FILENAME)
+RESOURCES_JSON_PATH = os.path.join(RESOURCES_DIR, JSON_FILENAME)
+
+# Local CSV exports, one per sheet (as downloaded by UpdateContent.command)
+CSV_FILES = {
+    "Sites": "1_sites.csv",
+    "SubLocations": "2_sublocations.csv",
+    "Cards": "3_cards.csv",
+    "Tips": "4_tips.csv",
+    "ArabicPhrases": "5_arabicphrases.csv"
+}
+
 def get_csv_url(spreadsheet_id: str, gid: int) -> str:
     """Generate CSV export URL for a specific sheet (using gviz format which works better)"""
     return f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/gviz/tq?tqx=out:csv&gid={gid}"
 
-def fetch_sheet_as_csv(spreadsheet_id: str, gid: int) -> list[dict]:
+def fetch_sheet_as_csv(spreadsheet_id: str, gid: int, timeout: int = 30) -> list[dict]:
     """Fetch a Google Sheet tab as CSV and return as list of dicts"""
     url = get_csv_url(spreadsheet_id, gid)
     try:
         req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-        with urllib.request.urlopen(req) as response:
-            content = response.read().decode('utf-8')
-            reader = csv.DictReader(content.splitlines())
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            # Parse straight off the socket instead of buffering the whole body
+            reader = csv.DictReader(io.TextIOWrapper(response, encoding='utf-8', newline=''))
             return list(reader)
     except Exception as e:
         print(f"Error fetching sheet (gid={gid}): {e}")
         return []
 
+def fetch_all_sheets_remote() -> dict:
+    """Fetch every sheet from Google Sheets concurrently (one request per tab)"""
+    with ThreadPoolExecutor(max_workers=len(SHEETS)) as executor:
+        futures = {
+            sheet_name: executor.submit(fetch_sheet_as_csv, SPREADSHEET_ID, gid)
+            for sheet_name, gid in SHEETS.items()
+        }
+        return {sheet_name: future.result() for sheet_name, future in futures.items()}
+
 def fetch_all_sheets_manually() -> dict:
     """
     Fetch sheets using the published CSV URLs.
@@ -660,21 +822,11 @@ def fetch_all_sheets_manually() -> dict:
     3. Update the GIDs below with your actual values
     """
     # For now, read from local CSV files as fallback
-    data_dir = os.path.join(os.path.dirname(__file__), 'data')
-
     sheets_data = {}
-    file_mapping = {
-        "Sites": "1_sites.csv",
-        "SubLocations": "2_sublocations.csv",
-        "Cards": "3_cards.csv",
-        "Tips": "4_tips.csv",
-        "ArabicPhrases": "5_arabicphrases.csv"
-    }
-
-    for sheet_name, filename in file_mapping.items():
-        filepath = os.path.join(data_dir, filename)
+    for sheet_name, filename in CSV_FILES.items():
+        filepath = os.path.join(DATA_DIR, filename)
         if os.path.exists(filepath):
-            with open(filepath, 'r', encoding='utf-8') as f:
+            with open(filepath, 'r', encoding='utf-8', newline='') as f:
                 reader = csv.DictReader(f)
                 sheets_data[sheet_name] = list(reader)
         else:
@@ -682,8 +834,92 @@ def fetch_all_sheets_manually() -> dict:
 
     return sheets_data
 
+def to_int(value, default: int = 0) -> int:
+    """Parse a sheet cell as int, falling back to default for blank/invalid values"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+def to_float(value, default: float = 0.0) -> float:
+    """Parse a sheet cell as float, falling back to default for blank/invalid values"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+# Validation rejects quiz cards with a missing option, so by conversion time
+# all four keys are present and can be fetched in one call
+get_quiz_options = itemgetter("quizOption1", "quizOption2", "quizOption3", "quizOption4")
+
+def coerce_card(card: dict) -> dict:
+    """Return a copy of a card row with its numeric fields parsed to int"""
+    return {
+        **card,
+        "order": to_int(card.get("order")),
+        "quizCorrectAnswer": to_int(card.get("quizCorrectAnswer"), 1),
+    }
+
+def build_sublocation(subloc: dict, cards_by_sublocation: dict) -> dict:
+    """Build one sublocation's app JSON entry with its already-sorted story cards"""
+    subloc_id = subloc.get("id", "")
+    return {
+        "id": subloc_id,
+        "name": subloc.get("name", ""),
+        "arabicName": subloc.get("arabicName", ""),
+        "shortDescription": subloc.get("shortDescription", ""),
+        "imageName": subloc.get("imageName") or None,
+        "storyCards": cards_by_sublocation.get(subloc_id, [])
+    }
+
+def build_site(site: dict, subloc_rows_by_site: dict, cards_by_sublocation: dict,
+               tips_by_site: dict, phrases_by_site: dict) -> dict:
+    """Build one site's app JSON entry (sublocations included) from its sheet row and the per-site lookups"""
+    intern = sys.intern
+    site_id = site.get("id", "")
+
+    # Parse coordinates
+    lat = to_float(site.get("latitude"))
+    lon = to_float(site.get("longitude"))
+
+    # Parse image names (comma-separated)
+    image_names = [img for img in map(str.strip, site.get("imageNames", "").split(",")) if img]
+
+    return {
+        "id": site_id,
+        "name": site.get("name", ""),
+        "arabicName": site.get("arabicName", ""),
+        "era": intern(site.get("era", "")),
+        "tourismType": intern(site.get("tourismType", "")),
+        "placeType": intern(site.get("placeType", "")),
+        "city": intern(site.get("city", "")),
+        "shortDescription": site.get("shortDescription", ""),
+        "coordinates": {
+            "latitude": lat,
+            "longitude": lon
+        },
+        "imageNames": image_names,
+        "subLocations": [
+            build_sublocation(subloc, cards_by_sublocation)
+            for subloc in subloc_rows_by_site.get(site_id, ())
+        ],
+        "visitInfo": {
+            "estimatedDuration": site.get("estimatedDuration", ""),
+            "bestTimeToVisit": site.get("bestTimeToVisit", ""),
+            "tips": tips_by_site.get(site_id, []),
+            "arabicPhrases": phrases_by_site.get(site_id, [])
+        },
+        "isUnlocked": True
+    }
+
 def convert_to_app_json(sheets_data: dict) -> dict:
     """Convert the sheets data to the app's JSON structure"""
+    # Grouping keys and card types repeat across many rows; interning
+    # stores each distinct string once and lets dict lookups hit identity
+    intern = sys.intern
+
+    # UTC with an offset so the app's ISO8601DateFormatter can parse it
+    now_iso = datetime.now(timezone.utc).isoformat(timespec="seconds")
 
     sites_raw = sheets_data.get("Sites", [])
     sublocations_raw = sheets_data.get("SubLocations", [])
@@ -692,191 +928,127 @@ def convert_to_app_json(sheets_data: dict) -> dict:
     phrases_raw = sheets_data.get("ArabicPhrases", [])
 
     # Build lookup maps
-    tips_by_site = {}
-    for tip in tips_raw:
-        site_id = tip.get("siteId", "")
-        if site_id not in tips_by_site:
-            tips_by_site[site_id] = []
-        tips_by_site[site_id].append(tip.get("tip", ""))
-
-    phrases_by_site = {}
-    for phrase in phrases_raw:
-        site_id = phrase.get("siteId", "")
-        if site_id not in phrases_by_site:
-            phrases_by_site[site_id] = []
-        phrases_by_site[site_id].append({
-            "english": phrase.get("english", ""),
-            "arabic": phrase.get("arabic", ""),
-            "pronunciation": phrase.get("pronunciation", "")
-        })
-
-    cards_by_sublocation = {}
-    for card in cards_raw:
-        subloc_id = card.get("subLocationId", "")
-        if subloc_id not in cards_by_sublocation:
-            cards_by_sublocation[subloc_id] = []
+    # Sort by site (tips also by display order) so each site's rows are
+    # contiguous and can be grouped in a single pass
+    tips_sorted = sorted(tips_raw, key=lambda t: (t.get("siteId", ""), to_int(t.get("order"))))
+    tips_by_site = {
+        intern(site_id): [tip.get("tip", "") for tip in group]
+        for site_id, group in groupby(tips_sorted, key=lambda t: t.get("siteId", ""))
+    }
+
+    phrases_sorted = sorted(phrases_raw, key=lambda p: p.get("siteId", ""))
+    phrases_by_site = {
+        intern(site_id): [
+            {
+                "english": phrase.get("english", ""),
+                "arabic": phrase.get("arabic", ""),
+                "pronunciation": phrase.get("pronunciation", "")
+            }
+            for phrase in group
+        ]
+        for site_id, group in groupby(phrases_sorted, key=lambda p: p.get("siteId", ""))
+    }
+
+    # Sort once up front so each sublocation's cards are appended in display
+    # order (stable, so equal orders keep their sheet order)
+    cards_sorted = sorted(map(coerce_card, cards_raw), key=itemgetter("order"))
+
+    cards_by_sublocation = defaultdict(list)
+    for card in cards_sorted:
+        get = card.get
+        card_id = get("id", "")
+        subloc_id = intern(get("subLocationId", ""))
+        quiz_question = get("quizQuestion")
 
         card_data = {
-            "id": card.get("id", ""),
-            "type": card.get("type", "story"),
-            "imageName": card.get("imageUrl") if card.get("imageUrl") else None,
-            "content": card.get("content") if card.get("content") else None,
-            "funFact": card.get("funFact") if card.get("funFact") else None,
+            "id": card_id,
+            "type": intern(get("type", "story")),
+            "imageName": get("imageUrl") or None,
+            "content": get("content") or None,
+            "funFact": get("funFact") or None,
         }
 
         # Add quiz data if present
-        if card.get("quizQuestion"):
+        if quiz_question:
             card_data["quizQuestion"] = {
-                "id": f"q_{card.get('id', '')}",
-                "question": card.get("quizQuestion", ""),
-                "options": [
-                    card.get("quizOption1", ""),
-                    card.get("quizOption2", ""),
-                    card.get("quizOption3", ""),
-                    card.get("quizOption4", "")
-                ],
-                "correctAnswerIndex": int(card.get("quizCorrectAnswer", 1)) - 1,  # Convert 1-based to 0-based
-                "explanation": card.get("quizExplanation", ""),
+                "id": f"q_{card_id}",
+                "question": quiz_question,
+                "options": [option or "" for option in get_quiz_options(card)],
+                "correctAnswerIndex": card["quizCorrectAnswer"] - 1,  # Convert 1-based to 0-based
+                "explanation": get("quizExplanation", ""),
                 "funFact": None
             }
         else:
             card_data["quizQuestion"] = None
 
-        # Store order for sorting
-        card_data["_order"] = int(card.get("order", 0) or 0)
         cards_by_sublocation[subloc_id].append(card_data)
 
-    # Sort cards by order and remove temporary _order field
-    for subloc_id in cards_by_sublocation:
-        cards_by_sublocation[subloc_id].sort(key=lambda x: x.get("_order", 0))
-        for card in cards_by_sublocation[subloc_id]:
-            card.pop("_order", None)
-
-    sublocations_by_site = {}
+    # Index the raw sublocation rows by site; each site then builds its
+    # sublocation entries inline, so there is no second site-keyed copy
+    subloc_rows_by_site = defaultdict(list)
     for subloc in sublocations_raw:
-        site_id = subloc.get("siteId", "")
-        if site_id not in sublocations_by_site:
-            sublocations_by_site[site_id] = []
-
-        subloc_id = subloc.get("id", "")
-        sublocations_by_site[site_id].append({
-            "id": subloc_id,
-            "name": subloc.get("name", ""),
-            "arabicName": subloc.get("arabicName", ""),
-            "shortDescription": subloc.get("shortDescription", ""),
-            "imageName": subloc.get("imageName") if subloc.get("imageName") else None,
-            "storyCards": cards_by_sublocation.get(subloc_id, [])
-        })
+        subloc_rows_by_site[intern(subloc.get("siteId", ""))].append(subloc)
 
     # Build sites
-    sites = []
-    for site in sites_raw:
-        site_id = site.get("id", "")
-
-        # Parse coordinates
-        lat = float(site.get("latitude", 0) or 0)
-        lon = float(site.get("longitude", 0) or 0)
-
-        # Parse image names (comma-separated)
-        image_names = [img.strip() for img in site.get("imageNames", "").split(",") if img.strip()]
-
-        site_data = {
-            "id": site_id,
-            "name": site.get("name", ""),
-            "arabicName": site.get("arabicName", ""),
-            "era": convert_era(site.get("era", "")),
-            "tourismType": convert_tourism_type(site.get("tourismType", "")),
-            "placeType": convert_place_type(site.get("placeType", "")),
-            "city": convert_city(site.get("city", "")),
-            "shortDescription": site.get("shortDescription", ""),
-            "coordinates": {
-                "latitude": lat,
-                "longitude": lon
-            },
-            "imageNames": image_names,
-            "subLocations": sublocations_by_site.get(site_id, []),
-            "visitInfo": {
-                "estimatedDuration": site.get("estimatedDuration", ""),
-                "bestTimeToVisit": site.get("bestTimeToVisit", ""),
-                "tips": tips_by_site.get(site_id, []),
-                "arabicPhrases": phrases_by_site.get(site_id, [])
-            },
-            "isUnlocked": True
-        }
-        sites.append(site_data)
+    sites = [
+        build_site(site, subloc_rows_by_site, cards_by_sublocation, tips_by_site, phrases_by_site)
+        for site in sites_raw
+    ]
 
     return {
         "version": "1.0",
-        "lastUpdated": datetime.now().isoformat(),
+        "lastUpdated": now_iso,
         "sites": sites
     }
 
-def convert_era(era_str: str) -> str:
-    """Convert era string to enum raw value"""
-    era_map = {
-        "Pre-Dynastic": "Pre-Dynastic",
-        "Old Kingdom": "Old Kingdom",
-        "Middle Kingdom": "Middle Kingdom",
-        "New Kingdom": "New Kingdom",
-        "Late Period": "Late Period",
-        "Ptolemaic": "Ptolemaic",
-        "Roman": "Roman",
-        "Islamic": "Islamic",
-        "Modern": "Modern"
-    }
-    return era_map.get(era_str, era_str)
-
-def convert_tourism_type(tourism_str: str) -> str:
-    """Convert tourism type string to enum raw value"""
-    tourism_map = {
-        "Pharaonic": "Pharaonic",
-        "Greco-Roman": "Greco-Roman",
-        "Coptic": "Coptic",
-        "Islamic": "Islamic",
-        "Modern": "Modern"
-    }
-    return tourism_map.get(tourism_str, tourism_str)
-
-def convert_place_type(place_str: str) -> str:
-    """Convert place type string to enum raw value"""
-    place_map = {
-        "Pyramid": "Pyramid",
-        "Temple": "Temple",
-        "Tomb": "Tomb",
-        "Museum": "Museum",
-        "Mosque": "Mosque",
-        "Church": "Church",
-        "Fortress": "Fortress",
-        "Market": "Market",
-        "Monument": "Monument",
-        "Ruins": "Ruins"
-    }
-    return place_map.get(place_str, place_str)
-
-def convert_city(city_str: str) -> str:
-    """Convert city string to enum raw value"""
-    city_map = {
-        "Cairo": "Cairo",
-        "Giza": "Giza",
-        "Luxor": "Luxor",
-        "Aswan": "Aswan",
-        "Alexandria": "Alexandria",
-        "Sinai": "Sinai",
-        "Fayoum": "Fayoum",
-        "Dahab": "Dahab",
-        "Hurghada": "Hurghada",
-        "Sharm El Sheikh": "Sharm El Sheikh"
-    }
-    return city_map.get(city_str, city_str)
+def keep_last_updated_if_unchanged(app_json: dict, previous_path: str) -> None:
+    """Reuse the previous file's lastUpdated when everything else is identical"""
+    try:
+        with open(previous_path, 'rb') as f:
+            previous = json.loads(f.read())
+    except (OSError, ValueError):
+        return  # No previous output (or unreadable) - keep the new timestamp
+
+    if not isinstance(previous, dict) or not isinstance(previous.get("lastUpdated"), str):
+        return
+
+    # Only carry over timestamps the app can parse (with a UTC offset);
+    # older naive ones are replaced by the fresh stamp
+    try:
+        if datetime.fromisoformat(previous["lastUpdated"]).tzinfo is None:
+            return
+    except ValueError:
+        return
+
+    if {**previous, "lastUpdated": None} == {**app_json, "lastUpdated": None}:
+        app_json["lastUpdated"] = previous["lastUpdated"]
+
+def write_if_changed(path: str, data: bytes) -> bool:
+    """Write data to path unless the file already holds exactly these bytes. Returns True if written."""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass  # Missing or unreadable - write it
+
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
 
 def main():
     print("=" * 60)
     print("       Unlock Egypt Content Sync")
     print("=" * 60)
 
-    # Fetch from local CSV files (or Google Sheets when configured)
-    print("\n1. Reading content from data files...")
-    sheets_data = fetch_all_sheets_manually()
+    # Fetch from local CSV files, or from Google Sheets with --remote
+    remote = "--remote" in sys.argv[1:]
+    if remote:
+        print("\n1. Fetching content from Google Sheets...")
+        sheets_data = fetch_all_sheets_remote()
+    else:
+        print("\n1. Reading content from data files...")
+        sheets_data = fetch_all_sheets_manually()
 
     print(f"   - Sites: {len(sheets_data.get('Sites', []))} records")
     print(f"   - SubLocations: {len(sheets_data.get('SubLocations', []))} records")
@@ -887,7 +1059,10 @@ def main():
     # Check if any sheets are empty
     if not sheets_data.get('Sites'):
         print("\n✗ ERROR: Sites sheet is empty or missing!")
-        print("  Make sure the CSV files exist in ContentManagement/data/")
+        if remote:
+            print("  Make sure the spreadsheet is published and the GIDs in SHEETS are correct")
+        else:
+            print("  Make sure the CSV files exist in ContentManagement/data/")
         sys.exit(1)
 
     # ==========================================================================
@@ -907,26 +1082,34 @@ def main():
     app_json = convert_to_app_json(sheets_data)
 
     # Ensure output directories exist
-    project_dir = os.path.dirname(os.path.dirname(__file__))
-    content_dir = os.path.join(project_dir, 'content')
-    resources_dir = os.path.join(project_dir, 'Resources')
-    os.makedirs(content_dir, exist_ok=True)
+    for output_dir in (CONTENT_DIR, RESOURCES_DIR):
+        os.makedirs(output_dir, exist_ok=True)
 
-    json_filename = 'unlock_egypt_content.json'
-    content_path = os.path.join(content_dir, json_filename)
-    resources_path = os.path.join(resources_dir, json_filename)
+    content_path = CONTENT_JSON_PATH
+    resources_path = RESOURCES_JSON_PATH
 
     print(f"\n4. Saving JSON files...")
 
-    # Save to content folder (for GitHub)
-    with open(content_path, 'w', encoding='utf-8') as f:
-        json.dump(app_json, f, indent=2, ensure_ascii=False)
-    print(f"   ✓ {content_path}")
-
-    # Also copy to Resources folder (bundled with app)
-    with open(resources_path, 'w', encoding='utf-8') as f:
-        json.dump(app_json, f, indent=2, ensure_ascii=False)
-    print(f"   ✓ {resources_path}")
+    # If only the timestamp would change, keep the old one so unchanged
+    # content produces identical files and no git churn
+    keep_last_updated_if_unchanged(app_json, content_path)
+
+    # Each file is encoded in full and written with a single write call,
+    # rather than json.dump streaming many small chunks through a text buffer
+
+    # Save to content folder (for GitHub) - indented so diffs stay readable
+    content_bytes = json.dumps(app_json, indent=2, ensure_ascii=False).encode('utf-8')
+    if write_if_changed(content_path, content_bytes):
+        print(f"   ✓ {content_path}")
+    else:
+        print(f"   = {content_path} (unchanged)")
+
+    # Also save to Resources folder (bundled with app) - compact, only the app reads it
+    resources_bytes = json.dumps(app_json, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    if write_if_changed(resources_path, resources_bytes):
+        print(f"   ✓ {resources_path}")
+    else:
+        print(f"   = {resources_path} (unchanged)")
 
     print(f"\n" + "=" * 60)
     print(f"✓ SUCCESS! Generated JSON with {len(app_json['sites'])} sites.")